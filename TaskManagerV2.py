@@ -3,19 +3,72 @@
 # Use: Personal Task Manager GUI with Tkinter
 
 
+import atexit
+import bisect
 import json
+import logging
+import mmap
+import operator
+import os
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Use orjson for faster JSON parsing/serialization when available,
+# falling back to the standard library otherwise
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(bytes(data))
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# Priority labels shown in the GUI, in sort order
+_PRIORITY_LABELS = ("High", "Medium", "Low")
+_PRIORITY_FILTER_LABELS = ("All",) + _PRIORITY_LABELS
+
+# Custom sort order for priority: high, medium, low
+_PRIORITY_ORDER = {label.lower(): rank for rank, label in enumerate(_PRIORITY_LABELS)}
+
+# Sort key for each sortable column
+_SORT_KEYS = {
+    'name': operator.attrgetter('_name_lc'),
+    'priority': operator.attrgetter('_prio_rank'),
+    # YYYY-MM-DD dates sort chronologically as plain strings
+    'due_date': operator.attrgetter('due_date'),
+}
+
+# Days in each month (index 1-12) for a non-leap year
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
 # Define the Task class to represent each task
 class Task:
+    # Fixed attribute set, so instances don't carry a per-instance __dict__
+    __slots__ = ("name", "description", "priority", "due_date",
+                 "_name_lc", "_priority_lc", "_prio_rank")
+
     def __init__(self, name, description, priority, due_date):
         # Initialize task properties
         self.name = name
         self.description = description
         self.priority = priority
         self.due_date = due_date
+        # Lowercased copies used for case-insensitive filtering and sorting
+        self._name_lc = name.lower()
+        self._priority_lc = priority.lower()
+        # Position in the priority sort order (unknown priorities sort last)
+        self._prio_rank = _PRIORITY_ORDER.get(self._priority_lc, 3)
 
     def to_dict(self):
         # Convert task properties to a dictionary for JSON serialization
@@ -38,85 +91,248 @@ class Task:
 
 # Define the TaskManager class to handle task operations
 class TaskManager:
-    def __init__(self, json_file='tasks.json'):
+    # Delay (ms) used to coalesce bursts of edits into a single save
+    SAVE_DELAY_MS = 500
+
+    def __init__(self, json_file='tasks.json', schedule=None, autoload=True):
         # Initialize TaskManager with a list of tasks and load tasks from JSON
+        # schedule is an optional root.after-style callable used to defer saves;
+        # without it every change is written immediately
+        # With autoload=False nothing is loaded until load_tasks_from_json() or start_loading()
         self.json_file = json_file
+        self.schedule = schedule
         self.tasks = []
-        self.load_tasks_from_json()
+        # Tasks stay in insertion order; each sortable column keeps a lazily built
+        # sorted list of (sort key, task index) pairs that is updated incrementally on changes
+        self._sorted_idx = {}
+        self._sort_key = None
+        self._sort_reverse = False
+        self._dirty = False
+        self._flush_scheduled = False
+        # Background loading state (see start_loading/poll_loaded)
+        self._loading = False
+        self._load_queue = queue.Queue()
+        # Set when the file could not be read, so saving never replaces it
+        self._load_failed = False
+        if autoload:
+            self.load_tasks_from_json()
+        if schedule is not None:
+            # Deferred saves may still be pending when the program exits
+            atexit.register(self.flush)
 
     def load_tasks_from_json(self):
         # Load tasks from a JSON file into the task list
         try:
-            with open(self.json_file, "r") as file:
-                task_dicts = json.load(file)
-                self.tasks = [Task.from_dict(task_dict) for task_dict in task_dicts]
-            print(f"Loaded {len(self.tasks)} tasks from {self.json_file}")
+            tasks = self._read_tasks()
+        except Exception:
+            self._load_failed = True
+            raise
+        self._load_failed = False
+        self._set_tasks(tasks)
+
+    def start_loading(self):
+        # Load tasks on a background thread; the GUI thread picks them up with poll_loaded()
+        self._loading = True
+        threading.Thread(target=self._load_worker, daemon=True).start()
+
+    def _load_worker(self):
+        # Always post a result, either the loaded tasks or the error that stopped the load
+        try:
+            result = self._read_tasks()
+        except Exception as error:
+            result = error
+        self._load_queue.put(result)
+
+    def poll_loaded(self):
+        # Install the tasks from a background load if it has finished; return True once loaded
+        # If the load failed, its error is re-raised here, on the caller's thread
+        try:
+            result = self._load_queue.get_nowait()
+        except queue.Empty:
+            return False
+        self._loading = False
+        failed = self._load_failed = isinstance(result, Exception)
+        if not failed:
+            # Keep any tasks added while loading at their existing indices, before the loaded ones
+            self._set_tasks(self.tasks + result)
+        # Saves were held back while loading; write any changes made in the meantime
+        if self._dirty and not failed:
+            self._mark_dirty()
+        if failed:
+            raise result
+        return True
+
+    def _read_tasks(self):
+        # Read the JSON file and return its tasks; touches no other state, so it can run on a worker thread
+        try:
+            with open(self.json_file, "rb") as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    # mmap can't map an empty file; parse it as-is so it's reported as invalid
+                    task_dicts = _json_loads(b"")
+                else:
+                    # Map the file and parse it in place rather than copying it into memory first
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        with memoryview(mapped) as view:
+                            task_dicts = _json_loads(view)
+            tasks = [Task.from_dict(task_dict) for task_dict in task_dicts]
+            logger.debug("Loaded %d tasks from %s", len(tasks), self.json_file)
+            return tasks
         except FileNotFoundError:
-            print(f"File {self.json_file} not found. Starting with empty task list.")
-            self.tasks = []
+            logger.debug("File %s not found. Starting with empty task list.", self.json_file)
+            return []
         except json.JSONDecodeError:
-            print(f"Error: Invalid JSON format in {self.json_file}. Starting with empty task list.")
-            self.tasks = []
+            logger.warning("Invalid JSON format in %s. Starting with empty task list.", self.json_file)
+            return []
+
+    def _set_tasks(self, tasks):
+        # Replace the task list and reset the indices built over it
+        self.tasks = tasks
+        self._sorted_idx.clear()
 
     def save_tasks_to_json(self):
-        # Save tasks to JSON file
-        with open(self.json_file, "w") as file:
-            task_dicts = [task.to_dict() for task in self.tasks]
-            json.dump(task_dicts, file, indent=2)
-        print(f"Tasks saved to {self.json_file}")
+        # Save tasks to a temporary file, then swap it in so a crash can't truncate the JSON
+        if self._load_failed:
+            # The file may still hold tasks we could not read; never overwrite it
+            logger.warning("Not saving: %s could not be loaded and is left unchanged.", self.json_file)
+            return
+        tmp_file = self.json_file + ".tmp"
+        task_dicts = [task.to_dict() for task in self.tasks]
+        try:
+            with open(tmp_file, "wb") as file:
+                file.write(_json_dumps(task_dicts))
+                # Make sure the data is on disk before it replaces the old file
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_file, self.json_file)
+        except BaseException:
+            # Don't leave a partial temporary file behind
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+            raise
+        self._dirty = False
+        logger.debug("Tasks saved to %s", self.json_file)
+
+    def _mark_dirty(self):
+        # Record an unsaved change and schedule one deferred save for the whole burst
+        self._dirty = True
+        if self.schedule is None:
+            self.flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.schedule(self.SAVE_DELAY_MS, self.flush)
+
+    def discard_changes(self):
+        # Forget unsaved changes so they are not written on the next flush
+        self._dirty = False
+
+    def flush(self):
+        # Write pending changes to disk, if any
+        self._flush_scheduled = False
+        # Never overwrite the file with a partial list while it is still being loaded
+        if self._dirty and not self._loading:
+            self.save_tasks_to_json()
 
     def get_filtered_tasks(self, name_filter=None, priority_filter=None, due_date_filter=None):
-        # Return tasks filtered by name, priority, or due date
-        filtered_tasks = self.tasks.copy()
-        
-        if name_filter and name_filter.strip():
-            filtered_tasks = [task for task in filtered_tasks if name_filter.lower() in task.name.lower()]
-        
-        if priority_filter and priority_filter.strip() and priority_filter.lower() != "all":
-            filtered_tasks = [task for task in filtered_tasks if task.priority.lower() == priority_filter.lower()]
-        
-        if due_date_filter and due_date_filter.strip():
-            filtered_tasks = [task for task in filtered_tasks if task.due_date == due_date_filter]
-        
-        return filtered_tasks
+        # Return (index, task) pairs filtered by name, priority, or due date, in the current sort order
+        # Normalize each filter once; None means the filter is not applied
+        name_lc = name_filter.lower() if name_filter and name_filter.strip() else None
+        priority_lc = priority_filter.lower() if priority_filter and priority_filter.strip() else None
+        if priority_lc == "all":
+            priority_lc = None
+        if not (due_date_filter and due_date_filter.strip()):
+            due_date_filter = None
+        
+        # Apply all filters in a single pass
+        tasks = self.tasks
+        return [(i, tasks[i]) for i in self._ordered_indices()
+                if (name_lc is None or name_lc in tasks[i]._name_lc)
+                and (priority_lc is None or tasks[i]._priority_lc == priority_lc)
+                and (due_date_filter is None or tasks[i].due_date == due_date_filter)]
 
     def sort_tasks(self, sort_key='name', reverse=False):
-        # Sort tasks by the specified key (e.g., name, priority, due date)
-        if sort_key == 'name':
-            self.tasks.sort(key=lambda task: task.name.lower(), reverse=reverse)
-        elif sort_key == 'priority':
-            # Custom sort order for priority: high, medium, low
-            priority_order = {"high": 0, "medium": 1, "low": 2}
-            self.tasks.sort(key=lambda task: priority_order.get(task.priority.lower(), 3), reverse=reverse)
-        elif sort_key == 'due_date':
-            self.tasks.sort(key=lambda task: datetime.strptime(task.due_date, "%Y-%m-%d"), reverse=reverse)
-        return self.tasks
+        # Select the sort order (e.g., name, priority, due date) and return tasks in that order
+        if sort_key in _SORT_KEYS:
+            self._sort_key = sort_key
+            self._sort_reverse = reverse
+        return [self.tasks[i] for i in self._ordered_indices()]
+
+    def _sorted_entries(self, sort_key):
+        # Return the sorted (key, index) pairs for a column, building them on first use
+        # (the index breaks ties, so tasks with equal keys stay in insertion order)
+        entries = self._sorted_idx.get(sort_key)
+        if entries is None:
+            key = _SORT_KEYS[sort_key]
+            entries = sorted((key(task), i) for i, task in enumerate(self.tasks))
+            self._sorted_idx[sort_key] = entries
+        return entries
+
+    def _ordered_indices(self):
+        # Return the task indices in the current sort order
+        if self._sort_key is None:
+            return range(len(self.tasks))
+        entries = self._sorted_entries(self._sort_key)
+        if not self._sort_reverse:
+            return [i for _, i in entries]
+        # Descending keys, but tasks with equal keys stay in insertion order (like a stable sort)
+        indices = []
+        end = len(entries)
+        while end:
+            start = bisect.bisect_left(entries, (entries[end - 1][0],))
+            indices.extend(i for _, i in entries[start:end])
+            end = start
+        return indices
+
+    def _index_insert(self, index):
+        # Insert a task index into each built permutation via binary search
+        task = self.tasks[index]
+        for sort_key, entries in self._sorted_idx.items():
+            bisect.insort(entries, (_SORT_KEYS[sort_key](task), index))
+
+    def _index_remove(self, index):
+        # Remove a task index from each built permutation via binary search
+        task = self.tasks[index]
+        for sort_key, entries in self._sorted_idx.items():
+            del entries[bisect.bisect_left(entries, (_SORT_KEYS[sort_key](task), index))]
 
     def add_task(self, name, description, priority, due_date):
         # Add a new task
         task = Task(name, description, priority, due_date)
         self.tasks.append(task)
-        self.save_tasks_to_json()
+        self._index_insert(len(self.tasks) - 1)
+        self._mark_dirty()
         return task
     
     def update_task(self, index, name, description, priority, due_date):
         # Update an existing task
         if 0 <= index < len(self.tasks):
+            self._index_remove(index)
             self.tasks[index] = Task(name, description, priority, due_date)
-            self.save_tasks_to_json()
+            self._index_insert(index)
+            self._mark_dirty()
             return True
         return False
     
     def delete_task(self, index):
         # Delete a task
         if 0 <= index < len(self.tasks):
+            self._index_remove(index)
             del self.tasks[index]
-            self.save_tasks_to_json()
+            # Later tasks shift down by one (which keeps each permutation sorted)
+            for entries in self._sorted_idx.values():
+                entries[:] = [(key, i - 1 if i > index else i) for key, i in entries]
+            self._mark_dirty()
             return True
         return False
 
 # Define the TaskManagerGUI class to create the Tkinter interface
 class TaskManagerGUI:
+    # Delay (ms) after the last keystroke before filters are re-applied
+    FILTER_DELAY_MS = 150
+    # Interval (ms) between checks for the background load to finish
+    LOAD_POLL_MS = 50
+
     def __init__(self, root):
         # Initialize GUI components and set up the Tkinter window
         self.root = root
@@ -124,9 +340,24 @@ class TaskManagerGUI:
         self.root.geometry("800x600")
         self.root.resizable(True, True)
         
-        self.task_manager = TaskManager()
+        # Tasks are loaded in the background so the window appears immediately
+        self.task_manager = TaskManager(schedule=self._schedule_save, autoload=False)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Row ids currently shown in the treeview (in display order) and their values
+        self._row_ids = []
+        self._row_values = {}
+        # Row id -> (task index, task); holding the task keeps its id() from being
+        # reused by a new task while its row is still in the tree
+        self._row_tasks = {}
+        
+        # Pending debounced filter refresh, if any
+        self._filter_after_id = None
+        
         self.setup_gui()
         self.populate_tree()
+        self.task_manager.start_loading()
+        self._poll_loading()
         
         # Track the current sort column and order
         self.sort_column = "name"
@@ -142,6 +373,10 @@ class TaskManagerGUI:
         title_label = ttk.Label(main_frame, text="Personal Task Manager", font=("Helvetica", 16, "bold"))
         title_label.pack(pady=10)
         
+        # Shown until the background load finishes
+        self.loading_label = ttk.Label(main_frame, text="Loading tasks...")
+        self.loading_label.pack()
+        
         # Search and Filter Section
         filter_frame = ttk.LabelFrame(main_frame, text="Search and Filter")
         filter_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -153,13 +388,14 @@ class TaskManagerGUI:
         name_label.pack(side=tk.LEFT, padx=5)
         self.name_filter = ttk.Entry(name_frame, width=30)
         self.name_filter.pack(side=tk.LEFT, padx=5)
+        self.name_filter.bind("<KeyRelease>", self._schedule_filter)
         
         # Filter by priority
         priority_frame = ttk.Frame(filter_frame)
         priority_frame.pack(fill=tk.X, padx=5, pady=5)
         priority_label = ttk.Label(priority_frame, text="Filter by Priority:")
         priority_label.pack(side=tk.LEFT, padx=5)
-        self.priority_filter = ttk.Combobox(priority_frame, width=10, values=["All", "High", "Medium", "Low"])
+        self.priority_filter = ttk.Combobox(priority_frame, width=10, values=_PRIORITY_FILTER_LABELS)
         self.priority_filter.current(0)
         self.priority_filter.pack(side=tk.LEFT, padx=5)
         
@@ -170,6 +406,7 @@ class TaskManagerGUI:
         date_label.pack(side=tk.LEFT, padx=5)
         self.date_filter = ttk.Entry(date_frame, width=15)
         self.date_filter.pack(side=tk.LEFT, padx=5)
+        self.date_filter.bind("<KeyRelease>", self._schedule_filter)
         
         # Filter button
         filter_button = ttk.Button(filter_frame, text="Apply Filters", command=self.apply_filter)
@@ -237,12 +474,13 @@ class TaskManagerGUI:
         
         delete_btn = ttk.Button(button_frame, text="Delete Task", command=self.delete_task)
         delete_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Task changes are disabled until the background load finishes
+        self.task_buttons = (add_btn, edit_btn, delete_btn)
+        for button in self.task_buttons:
+            button.state(["disabled"])
 
     def populate_tree(self):
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
         # Get current filters
         name_filter = self.name_filter.get()
         priority_filter = self.priority_filter.get()
@@ -251,10 +489,101 @@ class TaskManagerGUI:
         # Get filtered tasks
         filtered_tasks = self.task_manager.get_filtered_tasks(name_filter, priority_filter, date_filter)
         
-        # Insert tasks into the treeview
-        for task in filtered_tasks:
-            self.tree.insert("", tk.END, values=(task.name, task.description, task.priority, task.due_date))
+        # Build the desired rows, keyed by task identity so a row always refers to the same task
+        rows = [(str(id(task)), (task.name, task.description, task.priority, task.due_date))
+                for _, task in filtered_tasks]
+        new_ids = [row_id for row_id, _ in rows]
+        self._row_tasks = {row_id: pair for (row_id, _), pair in zip(rows, filtered_tasks)}
+        new_id_set = set(new_ids)
+        
+        # Remove rows that are no longer displayed, in a single Tcl call
+        stale_ids = [row_id for row_id in self._row_ids if row_id not in new_id_set]
+        if stale_ids:
+            self.tree.delete(*stale_ids)
+            for row_id in stale_ids:
+                del self._row_values[row_id]
+        
+        # Only move existing rows if their relative order has changed
+        kept_ids = [row_id for row_id in self._row_ids if row_id in new_id_set]
+        reorder = kept_ids != [row_id for row_id in new_ids if row_id in self._row_values]
+        
+        # Insert new rows and update changed ones in place
+        # (bound methods are looked up once since this loop runs per row)
+        insert, item, move = self.tree.insert, self.tree.item, self.tree.move
+        row_values = self._row_values
+        for position, (row_id, values) in enumerate(rows):
+            old_values = row_values.get(row_id)
+            if old_values is None:
+                insert("", position, iid=row_id, values=values)
+            else:
+                if old_values != values:
+                    item(row_id, values=values)
+                if reorder:
+                    move(row_id, "", position)
+            row_values[row_id] = values
+        
+        self._row_ids = new_ids
     
+    def _poll_loading(self):
+        # Show the tasks once the background load is done, otherwise check again shortly
+        try:
+            loaded = self.task_manager.poll_loaded()
+        except Exception as error:
+            # Task changes stay disabled: saving would overwrite the unreadable file
+            self.loading_label.pack_forget()
+            messagebox.showerror("Error", f"Could not load tasks from {self.task_manager.json_file}:\n{error}\n\n"
+                                          "The file has been left unchanged. Fix or move it and restart "
+                                          "the application to manage tasks.")
+            return
+        if loaded:
+            self._finish_loading()
+            self.populate_tree()
+        else:
+            self.root.after(self.LOAD_POLL_MS, self._poll_loading)
+
+    def _finish_loading(self):
+        # Hide the loading message and allow task changes
+        self.loading_label.pack_forget()
+        for button in self.task_buttons:
+            button.state(["!disabled"])
+
+    def on_close(self):
+        # Save any pending changes before closing the window
+        while True:
+            try:
+                self.task_manager.flush()
+                break
+            except OSError as error:
+                retry = messagebox.askretrycancel(
+                    "Error", f"Could not save tasks to {self.task_manager.json_file}:\n{error}\n\n"
+                             "Retry, or Cancel to close without saving.")
+                if not retry:
+                    self.task_manager.discard_changes()
+                    break
+        self.root.destroy()
+
+    def _schedule_save(self, delay_ms, flush):
+        # Run the task manager's deferred saves on the Tk event loop, reporting failures
+        self.root.after(delay_ms, lambda: self._run_save(flush))
+
+    def _run_save(self, flush):
+        try:
+            flush()
+        except OSError as error:
+            messagebox.showerror(
+                "Error", f"Could not save tasks to {self.task_manager.json_file}:\n{error}\n\n"
+                         "Your changes are kept and will be saved with the next change or when you close the window.")
+
+    def _schedule_filter(self, event=None):
+        # Re-apply filters once typing pauses, coalescing bursts of keystrokes
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(self.FILTER_DELAY_MS, self._run_scheduled_filter)
+
+    def _run_scheduled_filter(self):
+        self._filter_after_id = None
+        self.populate_tree()
+
     def apply_filter(self):
         # Apply filter criteria based on user input and refresh the task display
         self.populate_tree()
@@ -300,7 +629,7 @@ class TaskManagerGUI:
         desc_entry.grid(row=1, column=1, padx=10, pady=5)
         
         ttk.Label(add_window, text="Priority:").grid(row=2, column=0, padx=10, pady=5, sticky=tk.W)
-        priority_combo = ttk.Combobox(add_window, width=10, values=["High", "Medium", "Low"])
+        priority_combo = ttk.Combobox(add_window, width=10, values=_PRIORITY_LABELS)
         priority_combo.current(1)  # Default to "Medium"
         priority_combo.grid(row=2, column=1, padx=10, pady=5, sticky=tk.W)
         
@@ -340,21 +669,8 @@ class TaskManagerGUI:
             messagebox.showinfo("Selection Required", "Please select a task to edit")
             return
         
-        # Get the index of the selected task
-        item_id = selected_item[0]
-        item_values = self.tree.item(item_id, "values")
-        item_name = item_values[0]
-        
-        # Find the task index in the task_manager's list
-        task_index = -1
-        for i, task in enumerate(self.task_manager.tasks):
-            if task.name == item_name:
-                task_index = i
-                break
-        
-        if task_index == -1:
-            messagebox.showerror("Error", "Task not found")
-            return
+        # Look up the selected row's task and its index in the task manager's list
+        task_index = self._row_tasks[selected_item[0]][0]
         
         # Create edit window
         edit_window = tk.Toplevel(self.root)
@@ -378,8 +694,8 @@ class TaskManagerGUI:
         desc_entry.grid(row=1, column=1, padx=10, pady=5)
         
         ttk.Label(edit_window, text="Priority:").grid(row=2, column=0, padx=10, pady=5, sticky=tk.W)
-        priority_combo = ttk.Combobox(edit_window, width=10, values=["High", "Medium", "Low"])
-        priority_index = {"high": 0, "medium": 1, "low": 2}.get(task.priority.lower(), 1)
+        priority_combo = ttk.Combobox(edit_window, width=10, values=_PRIORITY_LABELS)
+        priority_index = _PRIORITY_ORDER.get(task._priority_lc, 1)
         priority_combo.current(priority_index)
         priority_combo.grid(row=2, column=1, padx=10, pady=5, sticky=tk.W)
         
@@ -423,21 +739,10 @@ class TaskManagerGUI:
             messagebox.showinfo("Selection Required", "Please select a task to delete")
             return
         
-        # Get the index of the selected task
+        # Look up the selected row's task and its index in the task manager's list
         item_id = selected_item[0]
-        item_values = self.tree.item(item_id, "values")
-        item_name = item_values[0]
-        
-        # Find the task index in the task_manager's list
-        task_index = -1
-        for i, task in enumerate(self.task_manager.tasks):
-            if task.name == item_name:
-                task_index = i
-                break
-        
-        if task_index == -1:
-            messagebox.showerror("Error", "Task not found")
-            return
+        task_index, task = self._row_tasks[item_id]
+        item_name = task.name
         
         # Confirm deletion
         confirm = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete task '{item_name}'?")
@@ -449,37 +754,30 @@ class TaskManagerGUI:
                 messagebox.showerror("Error", "Failed to delete task")
     
     def validate_date(self, date):
-        try:
-            # Check format YYYY-MM-DD
-            if len(date) != 10 or date[4] != '-' or date[7] != '-':
-                return False
-            
-            # Extract year, month, day
-            year = int(date[0:4])
-            month = int(date[5:7])
-            day = int(date[8:10])
-            
-            # Basic validation
-            if year < 1900 or year > 2100:
-                return False
-            if month < 1 or month > 12:
-                return False
-            
-            # Check day based on month
-            days_in_month = [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-            
-            # Adjust February for leap years
-            if year % 400 == 0 or (year % 100 != 0 and year % 4 == 0):
-                days_in_month[2] = 29
-                
-            if day < 1 or day > days_in_month[month]:
-                return False
-            return True
-        except (ValueError, IndexError):
+        # Check format YYYY-MM-DD (ASCII digits only, so int() below cannot fail)
+        if len(date) != 10 or date[4] != '-' or date[7] != '-' or not date.isascii():
+            return False
+        
+        # Extract year, month, day
+        year, month, day = date[0:4], date[5:7], date[8:10]
+        if not (year.isdigit() and month.isdigit() and day.isdigit()):
             return False
+        year, month, day = int(year), int(month), int(day)
+        
+        # Basic validation
+        if year < 1900 or year > 2100:
+            return False
+        if month < 1 or month > 12:
+            return False
+        
+        # Check day based on month, adjusting February for leap years
+        leap = year % 400 == 0 or (year % 100 != 0 and year % 4 == 0)
+        max_day = 29 if month == 2 and leap else _DAYS_IN_MONTH[month]
+        return 1 <= day <= max_day
 
 # Main program execution
 if __name__ == "__main__":
+    logging.basicConfig()
     root = tk.Tk()
     app = TaskManagerGUI(root)
     root.mainloop()
\ No newline at end of file